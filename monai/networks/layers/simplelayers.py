@@ -52,28 +52,31 @@ class GaussianFilter:
         self.padding = same_padding(self.kernel.size()[0])
         self.device = device
 
-        self.kernel = self.kernel.to(self.device)
+        self.kernel = self.kernel.to(device=self.device, dtype=torch.float)
+        # the 1D kernel oriented along each spatial axis, the filter is applied as one 1D pass per axis.
+        self.axis_kernels = []
+        for d in range(spatial_dims):
+            s = [1] * (spatial_dims + 2)
+            s[d + 2] = -1
+            self.axis_kernels.append(self.kernel.reshape(s))
 
     def __call__(self, x):
         """
         Args:
             x (tensor): in shape [Batch, chns, H, W, D].
         """
-        if not torch.is_tensor(x):
-            x = torch.Tensor(x)
-        chns = x.shape[1]
+        x = torch.as_tensor(x, dtype=torch.float, device=self.device)
+        shape = x.shape
         sp_dim = self.spatial_dims
-        x = x.to(self.device)
+        # all channels share the kernel: fold them into the batch dimension and filter them in the same passes,
+        # instead of replicating the kernel for a grouped convolution.
+        x = x.reshape([-1, 1] + list(shape[2:]))
 
         def _conv(input_, d):
             if d < 0:
                 return input_
-            s = [1] * (sp_dim + 2)
-            s[d + 2] = -1
-            kernel = self.kernel.reshape(s).float()
-            kernel = kernel.repeat([chns, 1] + [1] * sp_dim)
             padding = [0] * sp_dim
             padding[d] = self.padding
-            return self.conv_n(input=_conv(input_, d - 1), weight=kernel, padding=padding, groups=chns)
+            return self.conv_n(input=_conv(input_, d - 1), weight=self.axis_kernels[d], padding=padding)
 
-        return _conv(x, sp_dim - 1)
+        return _conv(x, sp_dim - 1).reshape(shape)
@@ -16,17 +16,15 @@ Class names are ended with 'd' to denote dictionary-based transforms.
 """
 
 import numpy as np
-import torch
 
 from monai.data.utils import get_random_patch, get_valid_patch_size
-from monai.networks.layers.simplelayers import GaussianFilter
 from monai.transforms.compose import MapTransform, Randomizable
 from monai.transforms.transforms import (AddChannel, AsChannelFirst, Flip, LoadNifti, NormalizeIntensity, Orientation,
                                          Rand2DElastic, Rand3DElastic, RandAffine, Resize, Rotate, Rotate90,
                                          ScaleIntensityRange, Spacing, SpatialCrop, Zoom, ToTensor, LoadPNG,
                                          AsChannelLast, ThresholdIntensity, AdjustContrast, CenterSpatialCrop,
                                          CastToType, SpatialPad, RepeatChannel, ShiftIntensity, ScaleIntensity)
-from monai.transforms.utils import (create_grid, generate_pos_neg_label_crop_centers, generate_spatial_bounding_box)
+from monai.transforms.utils import generate_pos_neg_label_crop_centers, generate_spatial_bounding_box
 from monai.utils.misc import ensure_tuple
 
 
@@ -1000,11 +998,7 @@ class RandAffined(Randomizable, MapTransform):
         d = dict(data)
         self.randomize()
 
-        spatial_size = self.rand_affine.spatial_size
-        if self.rand_affine.do_transform:
-            grid = self.rand_affine.rand_affine_grid(spatial_size=spatial_size)
-        else:
-            grid = create_grid(spatial_size)
+        grid = self.rand_affine.sampling_grid(self.rand_affine.spatial_size)
 
         if isinstance(self.mode, (tuple, list)):
             for key, m in zip(self.keys, self.mode):
@@ -1024,7 +1018,8 @@ class Rand2DElasticd(Randomizable, MapTransform):
     def __init__(self, keys,
                  spatial_size, spacing, magnitude_range, prob=0.1,
                  rotate_range=None, shear_range=None, translate_range=None, scale_range=None,
-                 mode='bilinear', padding_mode='zeros', as_tensor_output=False, device=None):
+                 mode='bilinear', padding_mode='zeros', as_tensor_output=False, device=None,
+                 grid_upsample_mode='bicubic'):
         """
         Args:
             keys (Hashable items): keys of the corresponding items to be transformed.
@@ -1043,6 +1038,8 @@ class Rand2DElasticd(Randomizable, MapTransform):
             as_tensor_output (bool): the computation is implemented using pytorch tensors, this option specifies
                 whether to convert it back to numpy arrays.
             device (torch.device): device on which the tensor will be allocated.
+            grid_upsample_mode ('bicubic'|'bilinear'): interpolation mode used to upsample the deformed control
+                grid to ``spatial_size``. Defaults to ``'bicubic'``.
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
             - :py:class:`Affine` for the affine transformation parameters configurations.
@@ -1054,7 +1051,8 @@ class Rand2DElasticd(Randomizable, MapTransform):
                                              translate_range=translate_range, scale_range=scale_range,
                                              spatial_size=spatial_size,
                                              mode=default_mode, padding_mode=padding_mode,
-                                             as_tensor_output=as_tensor_output, device=device)
+                                             as_tensor_output=as_tensor_output, device=device,
+                                             grid_upsample_mode=grid_upsample_mode)
         self.mode = mode
 
     def set_random_state(self, seed=None, state=None):
@@ -1069,13 +1067,7 @@ class Rand2DElasticd(Randomizable, MapTransform):
         d = dict(data)
         spatial_size = self.rand_2d_elastic.spatial_size
         self.randomize(spatial_size)
-
-        if self.rand_2d_elastic.do_transform:
-            grid = self.rand_2d_elastic.deform_grid(spatial_size)
-            grid = self.rand_2d_elastic.rand_affine_grid(grid=grid)
-            grid = torch.nn.functional.interpolate(grid[None], spatial_size, mode='bicubic', align_corners=False)[0]
-        else:
-            grid = create_grid(spatial_size)
+        grid = self.rand_2d_elastic.elastic_grid(spatial_size)
 
         if isinstance(self.mode, (tuple, list)):
             for key, m in zip(self.keys, self.mode):
@@ -1141,13 +1133,7 @@ class Rand3DElasticd(Randomizable, MapTransform):
         d = dict(data)
         spatial_size = self.rand_3d_elastic.spatial_size
         self.randomize(spatial_size)
-        grid = create_grid(spatial_size)
-        if self.rand_3d_elastic.do_transform:
-            device = self.rand_3d_elastic.device
-            grid = torch.tensor(grid).to(device)
-            gaussian = GaussianFilter(spatial_dims=3, sigma=self.rand_3d_elastic.sigma, truncated=3., device=device)
-            grid[:3] += gaussian(self.rand_3d_elastic.rand_offset[None])[0] * self.rand_3d_elastic.magnitude
-            grid = self.rand_3d_elastic.rand_affine_grid(grid=grid)
+        grid = self.rand_3d_elastic.elastic_grid(spatial_size)
 
         if isinstance(self.mode, (tuple, list)):
             for key, m in zip(self.keys, self.mode):
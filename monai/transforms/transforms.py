@@ -441,12 +441,12 @@ class Flip(Transform):
         Args:
             img (ndarray): channel first array, must have shape: (num_channels, H[, W, ..., ]),
         """
-        flipped = list()
-        for channel in img:
-            flipped.append(
-                np.flip(channel, self.spatial_axis)
-            )
-        return np.stack(flipped)
+        if self.spatial_axis is None:
+            axis = tuple(range(1, img.ndim))
+        else:  # shift non-negative spatial axes past the channel dimension
+            axis = tuple(ax + 1 if ax >= 0 else ax for ax in ensure_tuple(self.spatial_axis))
+        # a single contiguous copy, so that a following ToTensor does not need another one.
+        return np.ascontiguousarray(np.flip(img, axis))
 
 
 class Resize(Transform):
@@ -727,6 +727,7 @@ class NormalizeIntensity(Transform):
     divisor, otherwise the shape can have dimension 1 for channels).
     This transform can normalize only non-zero values or entire image, and can also calculate
     mean and std on each channel separately.
+    A floating point torch tensor is normalized on its own device when `nonzero` is False.
 
     Args:
         subtrahend (ndarray): the amount to subtract by (usually the mean).
@@ -746,6 +747,26 @@ class NormalizeIntensity(Transform):
         self.channel_wise = channel_wise
 
     def _normalize(self, img):
+        if torch.is_tensor(img) and not self.nonzero and img.is_floating_point():
+            # the statistics and the update are computed on the tensor's device, without a round trip to numpy.
+            if img.numel() > 0:
+                if self.subtrahend is not None and self.divisor is not None:
+                    subtrahend = torch.as_tensor(self.subtrahend, dtype=img.dtype, device=img.device)
+                    divisor = torch.as_tensor(self.divisor, dtype=img.dtype, device=img.device)
+                else:
+                    subtrahend, divisor = img.mean(), img.std(unbiased=False)
+                img.sub_(subtrahend).div_(divisor)
+            return img
+        if not self.nonzero and np.issubdtype(img.dtype, np.floating):
+            # the whole image is normalized: subtract and divide in place, no mask or gathered copies.
+            if img.size > 0:
+                if self.subtrahend is not None and self.divisor is not None:
+                    subtrahend, divisor = self.subtrahend, self.divisor
+                else:
+                    subtrahend, divisor = np.mean(img), np.std(img)
+                np.subtract(img, subtrahend, out=img)
+                np.divide(img, divisor, out=img)
+            return img
         slices = (img != 0) if self.nonzero else np.ones(img.shape, dtype=np.bool_)
         if np.any(slices):
             if self.subtrahend is not None and self.divisor is not None:
@@ -886,12 +907,9 @@ class Rotate90(Transform):
         Args:
             img (ndarray): channel first array, must have shape: (num_channels, H[, W, ..., ]),
         """
-        rotated = list()
-        for channel in img:
-            rotated.append(
-                np.rot90(channel, self.k, self.spatial_axes)
-            )
-        return np.stack(rotated)
+        # rotate all channels at once, shifting non-negative spatial axes past the channel dimension.
+        axes = tuple(ax + 1 if ax >= 0 else ax for ax in self.spatial_axes)
+        return np.ascontiguousarray(np.rot90(img, self.k, axes))
 
 
 class RandRotate90(Randomizable, Transform):
@@ -963,6 +981,11 @@ class SpatialPad(Transform):
     def __call__(self, img):
         data_pad_width = self._determine_data_pad_width(img.shape[1:])
         all_pad_width = [(0, 0)] + data_pad_width
+        if self.mode == 'constant':
+            # zero padding: fill a preallocated output instead of going through the generic np.pad.
+            padded = np.zeros([d + sum(w) for d, w in zip(img.shape, all_pad_width)], dtype=img.dtype)
+            padded[tuple(slice(w[0], w[0] + d) for d, w in zip(img.shape, all_pad_width))] = img
+            return padded
         img = np.pad(img, all_pad_width, self.mode)
         return img
 
@@ -984,28 +1007,26 @@ class SpatialCrop(Transform):
             roi_start (list or tuple): voxel coordinates for start of the crop ROI.
             roi_end (list or tuple): voxel coordinates for end of the crop ROI.
         """
+        # plain python ints, the per-call bound checks are scalar comparisons without numpy dispatch.
         if roi_center is not None and roi_size is not None:
-            roi_center = np.asarray(roi_center, dtype=np.uint16)
-            roi_size = np.asarray(roi_size, dtype=np.uint16)
-            self.roi_start = np.subtract(roi_center, np.floor_divide(roi_size, 2))
-            self.roi_end = np.add(self.roi_start, roi_size)
+            self.roi_start = tuple(int(c) - int(s) // 2 for c, s in zip(roi_center, roi_size))
+            self.roi_end = tuple(start + int(s) for start, s in zip(self.roi_start, roi_size))
         else:
             assert roi_start is not None and roi_end is not None, 'roi_start and roi_end must be provided.'
-            self.roi_start = np.asarray(roi_start, dtype=np.uint16)
-            self.roi_end = np.asarray(roi_end, dtype=np.uint16)
+            self.roi_start = tuple(int(s) for s in roi_start)
+            self.roi_end = tuple(int(e) for e in roi_end)
 
-        assert np.all(self.roi_start >= 0), 'all elements of roi_start must be greater than or equal to 0.'
-        assert np.all(self.roi_end > 0), 'all elements of roi_end must be positive.'
-        assert np.all(self.roi_end >= self.roi_start), 'invalid roi range.'
+        assert all(s >= 0 for s in self.roi_start), 'all elements of roi_start must be greater than or equal to 0.'
+        assert all(e > 0 for e in self.roi_end), 'all elements of roi_end must be positive.'
+        assert all(e >= s for s, e in zip(self.roi_start, self.roi_end)), 'invalid roi range.'
 
     def __call__(self, img):
         max_end = img.shape[1:]
-        sd = min(len(self.roi_start), len(max_end))
-        assert np.all(max_end[:sd] >= self.roi_start[:sd]), 'roi start out of image space.'
-        assert np.all(max_end[:sd] >= self.roi_end[:sd]), 'roi end out of image space.'
+        assert all(m >= s for m, s in zip(max_end, self.roi_start)), 'roi start out of image space.'
+        assert all(m >= e for m, e in zip(max_end, self.roi_end)), 'roi end out of image space.'
 
-        slices = [slice(None)] + [slice(s, e) for s, e in zip(self.roi_start[:sd], self.roi_end[:sd])]
-        return img[tuple(slices)]
+        slices = (slice(None),) + tuple(slice(s, e) for s, e in zip(self.roi_start, self.roi_end))
+        return img[slices]
 
 
 class CenterSpatialCrop(Transform):
@@ -1231,6 +1252,19 @@ class RandZoom(Randomizable, Transform):
         return zoomer(img)
 
 
+def _cached_identity_grid(cache, spatial_size, device, dtype=None):
+    """
+    Returns a `((spatial_size, device), grid)` pair holding the identity grid of `spatial_size` as a tensor,
+    `cache` (a previously returned pair or None) is returned as is if its key matches. The pair is meant to be
+    stored in a single attribute, so that a grid is never read with the key of another one.
+    `dtype` defaults to the float64 type of :py:func:`monai.transforms.utils.create_grid`.
+    """
+    key = (tuple(spatial_size), device)
+    if cache is None or cache[0] != key:
+        cache = (key, torch.as_tensor(create_grid(spatial_size), dtype=dtype, device=device))
+    return cache
+
+
 class AffineGrid(Transform):
     """
     Affine transforms on the coordinates.
@@ -1251,6 +1285,10 @@ class AffineGrid(Transform):
         self.as_tensor_output = as_tensor_output
         self.device = device
 
+        self._grid_cache = None
+        self._affine_cache = None
+        self._cache_affine = True
+
     def __call__(self, spatial_size=None, grid=None):
         """
         Args:
@@ -1258,12 +1296,35 @@ class AffineGrid(Transform):
             grid (ndarray): grid to be transformed. Shape must be (3, H, W) for 2D or (4, H, W, D) for 3D.
         """
         if grid is None:
-            if spatial_size is not None:
-                grid = create_grid(spatial_size)
-            else:
+            if spatial_size is None:
                 raise ValueError('Either specify a grid or a spatial size to create a grid from.')
+            # the identity grid only depends on `spatial_size` and the device, it is never modified in place.
+            cache = _cached_identity_grid(self._grid_cache, spatial_size, self.device, torch.float)
+            self._grid_cache = cache
+            grid = cache[1]
+
+        # the matmul allocates the output grid, so the input is only converted (not cloned) to float on the device.
+        grid = torch.as_tensor(np.ascontiguousarray(grid)) if not torch.is_tensor(grid) else grid.detach()
+        grid = grid.to(device=self.device or grid.device, dtype=torch.float)
 
         spatial_dims = len(grid.shape) - 1
+        if self._cache_affine:
+            params = (self.rotate_params, self.shear_params, self.translate_params, self.scale_params)
+            # copies of the parameters, so that in-place changes to the user's lists also invalidate the matrix.
+            key = (spatial_dims, grid.device) + tuple(None if p is None else np.asarray(p).tolist() for p in params)
+            cache = self._affine_cache
+            if cache is None or cache[0] != key:
+                cache = (key, self._create_affine(spatial_dims, grid.device))
+                self._affine_cache = cache
+            affine = cache[1]
+        else:
+            affine = self._create_affine(spatial_dims, grid.device)
+        grid = (affine @ grid.reshape((grid.shape[0], -1))).reshape([-1] + list(grid.shape[1:]))
+        if self.as_tensor_output:
+            return grid
+        return grid.cpu().numpy()
+
+    def _create_affine(self, spatial_dims, device):
         affine = np.eye(spatial_dims + 1)
         if self.rotate_params:
             affine = affine @ create_rotate(spatial_dims, self.rotate_params)
@@ -1273,15 +1334,7 @@ class AffineGrid(Transform):
             affine = affine @ create_translate(spatial_dims, self.translate_params)
         if self.scale_params:
             affine = affine @ create_scale(spatial_dims, self.scale_params)
-        affine = torch.as_tensor(np.ascontiguousarray(affine), device=self.device)
-
-        grid = torch.as_tensor(np.ascontiguousarray(grid)) if not torch.is_tensor(grid) else grid.detach().clone()
-        if self.device:
-            grid = grid.to(self.device)
-        grid = (affine.float() @ grid.reshape((grid.shape[0], -1)).float()).reshape([-1] + list(grid.shape[1:]))
-        if self.as_tensor_output:
-            return grid
-        return grid.cpu().numpy()
+        return torch.as_tensor(np.ascontiguousarray(affine), dtype=torch.float, device=device)
 
 
 class RandAffineGrid(Randomizable, Transform):
@@ -1333,15 +1386,24 @@ class RandAffineGrid(Randomizable, Transform):
         self.as_tensor_output = as_tensor_output
         self.device = device
 
+        self.affine_grid = AffineGrid(as_tensor_output=as_tensor_output, device=device)
+        # the parameters are redrawn for every call, a cached matrix would never be reused.
+        self.affine_grid._cache_affine = False
+
+    def _rand_params(self, param_range):
+        # one vectorised draw per parameter group, consuming the random state in the same order as scalar draws.
+        bound = np.asarray([f for f in param_range if f is not None], dtype=float)
+        return self.R.uniform(-bound, bound)
+
     def randomize(self):
         if self.rotate_range:
-            self.rotate_params = [self.R.uniform(-f, f) for f in self.rotate_range if f is not None]
+            self.rotate_params = self._rand_params(self.rotate_range).tolist()
         if self.shear_range:
-            self.shear_params = [self.R.uniform(-f, f) for f in self.shear_range if f is not None]
+            self.shear_params = self._rand_params(self.shear_range).tolist()
         if self.translate_range:
-            self.translate_params = [self.R.uniform(-f, f) for f in self.translate_range if f is not None]
+            self.translate_params = self._rand_params(self.translate_range).tolist()
         if self.scale_range:
-            self.scale_params = [self.R.uniform(-f, f) + 1.0 for f in self.scale_range if f is not None]
+            self.scale_params = (self._rand_params(self.scale_range) + 1.0).tolist()
 
     def __call__(self, spatial_size=None, grid=None):
         """
@@ -1349,9 +1411,14 @@ class RandAffineGrid(Randomizable, Transform):
             a 2D (3xHxW) or 3D (4xHxWxD) grid.
         """
         self.randomize()
-        affine_grid = AffineGrid(rotate_params=self.rotate_params, shear_params=self.shear_params,
-                                 translate_params=self.translate_params, scale_params=self.scale_params,
-                                 as_tensor_output=self.as_tensor_output, device=self.device)
+        # a persistent AffineGrid keeps its identity grid cached across calls with the same spatial size.
+        affine_grid = self.affine_grid
+        affine_grid.rotate_params = self.rotate_params
+        affine_grid.shear_params = self.shear_params
+        affine_grid.translate_params = self.translate_params
+        affine_grid.scale_params = self.scale_params
+        affine_grid.as_tensor_output = self.as_tensor_output
+        affine_grid.device = self.device
         return affine_grid(spatial_size, grid)
 
 
@@ -1410,30 +1477,46 @@ class Resample(Transform):
         self.as_tensor_output = as_tensor_output
         self.device = device
 
-    def __call__(self, img, grid, mode='bilinear'):
+    def __call__(self, img, grid, mode='bilinear', batched=False):
         """
         Args:
             img (ndarray or tensor): shape must be (num_channels, H, W[, D]).
             grid (ndarray or tensor): shape must be (3, H, W) for 2D or (4, H, W, D) for 3D.
             mode ('nearest'|'bilinear'): interpolation order. Defaults to 'bilinear'.
+            batched (bool): whether `img` is a batch of images in shape (batch, num_channels, H, W[, D]).
+                `grid` is then either shared by all the images, or has one grid per image in shape
+                (batch, 3, H, W) for 2D or (batch, 4, H, W, D) for 3D. the whole batch is resampled
+                in a single ``grid_sample`` call. Defaults to False.
         """
         if not torch.is_tensor(img):
             img = torch.as_tensor(np.ascontiguousarray(img))
-        grid = torch.as_tensor(np.ascontiguousarray(grid)) if not torch.is_tensor(grid) else grid.detach().clone()
+        grid = torch.as_tensor(np.ascontiguousarray(grid)) if not torch.is_tensor(grid) else grid.detach()
         if self.device:
             img = img.to(self.device)
             grid = grid.to(self.device)
-
-        for i, dim in enumerate(img.shape[1:]):
-            grid[i] = 2. * grid[i] / (dim - 1.)
-        grid = grid[:-1] / grid[-1:]
-        grid = grid[range(img.ndim - 2, -1, -1)]
-        grid = grid.permute(list(range(grid.ndim))[1:] + [0])
-        out = torch.nn.functional.grid_sample(img[None].float(),
-                                              grid[None].float(),
+        if not grid.is_floating_point():
+            grid = grid.float()
+
+        if not batched:
+            img = img[None]
+        if grid.ndim == img.ndim - 1:  # a single grid, shared by the batch
+            grid = grid[None]
+        spatial_dims = img.ndim - 2
+        # reverse the coordinates order, normalise them to [-1, 1] and divide by the homogeneous coordinate.
+        # the indexing allocates the output, the rest is in place, so the input `grid` is never modified.
+        dims = torch.as_tensor(list(img.shape[2:])[::-1], dtype=grid.dtype, device=grid.device)
+        scale = (2. / (dims - 1.)).reshape([1, -1] + [1] * spatial_dims)
+        grid = grid[:, list(range(spatial_dims - 1, -1, -1)) + [-1]]
+        grid = grid[:, :-1].mul_(scale).div_(grid[:, -1:])
+        grid = grid.permute([0] + list(range(2, grid.ndim)) + [1])
+        grid = grid.expand([img.shape[0]] + list(grid.shape[1:]))
+        out = torch.nn.functional.grid_sample(img.float(),
+                                              grid.float(),
                                               mode=mode,
                                               padding_mode=self.padding_mode,
-                                              align_corners=False)[0]
+                                              align_corners=False)
+        if not batched:
+            out = out[0]
         if self.as_tensor_output:
             return out
         return out.cpu().numpy()
@@ -1546,6 +1629,8 @@ class RandAffine(Randomizable, Transform):
         self.do_transform = False
         self.prob = prob
 
+        self._identity_grid = None
+
     def set_random_state(self, seed=None, state=None):
         self.rand_affine_grid.set_random_state(seed, state)
         super().set_random_state(seed, state)
@@ -1567,11 +1652,21 @@ class RandAffine(Randomizable, Transform):
         self.randomize()
         spatial_size = spatial_size or self.spatial_size
         mode = mode or self.mode
+        return self.resampler(img=img, grid=self.sampling_grid(spatial_size), mode=mode)
+
+    def sampling_grid(self, spatial_size):
+        """
+        Build the sampling grid of the current random parameters, `randomize` must be called first.
+        The identity grid of the untransformed case is cached and shared across calls, it must not be modified.
+
+        Args:
+            spatial_size (list or tuple of int): output grid spatial size.
+        """
         if self.do_transform:
-            grid = self.rand_affine_grid(spatial_size=spatial_size)
-        else:
-            grid = create_grid(spatial_size)
-        return self.resampler(img=img, grid=grid, mode=mode)
+            return self.rand_affine_grid(spatial_size=spatial_size)
+        cache = _cached_identity_grid(self._identity_grid, spatial_size, self.resampler.device)
+        self._identity_grid = cache
+        return cache[1]
 
 
 class Rand2DElastic(Randomizable, Transform):
@@ -1591,7 +1686,8 @@ class Rand2DElastic(Randomizable, Transform):
                  mode='bilinear',
                  padding_mode='zeros',
                  as_tensor_output=False,
-                 device=None):
+                 device=None,
+                 grid_upsample_mode='bicubic'):
         """
         Args:
             spacing (2 ints): distance in between the control points.
@@ -1607,6 +1703,9 @@ class Rand2DElastic(Randomizable, Transform):
             as_tensor_output (bool): the computation is implemented using pytorch tensors, this option specifies
                 whether to convert it back to numpy arrays.
             device (torch.device): device on which the tensor will be allocated.
+            grid_upsample_mode ('bicubic'|'bilinear'): interpolation mode used to upsample the deformed control
+                grid to ``spatial_size``. Defaults to ``'bicubic'``, ``'bilinear'`` is faster (4 instead of 16 taps
+                per output pixel) and usually sufficient for smooth deformation fields.
 
         See also:
             - :py:class:`RandAffineGrid` for the random affine parameters configurations.
@@ -1621,9 +1720,12 @@ class Rand2DElastic(Randomizable, Transform):
 
         self.spatial_size = spatial_size
         self.mode = mode
+        self.grid_upsample_mode = grid_upsample_mode
         self.prob = prob
         self.do_transform = False
 
+        self._identity_grid = None
+
     def set_random_state(self, seed=None, state=None):
         self.deform_grid.set_random_state(seed, state)
         self.rand_affine_grid.set_random_state(seed, state)
@@ -1645,13 +1747,24 @@ class Rand2DElastic(Randomizable, Transform):
         spatial_size = spatial_size or self.spatial_size
         self.randomize(spatial_size)
         mode = mode or self.mode
+        return self.resampler(img, self.elastic_grid(spatial_size), mode)
+
+    def elastic_grid(self, spatial_size):
+        """
+        Build the sampling grid of the current random parameters, `randomize` must be called first.
+        The identity grid of the untransformed case is cached and shared across calls, it must not be modified.
+
+        Args:
+            spatial_size (2 ints): specifying output image spatial size [h, w].
+        """
         if self.do_transform:
             grid = self.deform_grid(spatial_size=spatial_size)
             grid = self.rand_affine_grid(grid=grid)
-            grid = torch.nn.functional.interpolate(grid[None], spatial_size, mode='bicubic', align_corners=False)[0]
-        else:
-            grid = create_grid(spatial_size)
-        return self.resampler(img, grid, mode)
+            return torch.nn.functional.interpolate(grid[None], spatial_size, mode=self.grid_upsample_mode,
+                                                   align_corners=False)[0]
+        cache = _cached_identity_grid(self._identity_grid, spatial_size, self.resampler.device)
+        self._identity_grid = cache
+        return cache[1]
 
 
 class Rand3DElastic(Randomizable, Transform):
@@ -1707,6 +1820,9 @@ class Rand3DElastic(Randomizable, Transform):
         self.rand_offset = None
         self.magnitude = 1.0
         self.sigma = 1.0
+        self.gaussian = None
+
+        self._grid_cache = None
 
     def set_random_state(self, seed=None, state=None):
         self.rand_affine_grid.set_random_state(seed, state)
@@ -1716,9 +1832,15 @@ class Rand3DElastic(Randomizable, Transform):
     def randomize(self, grid_size):
         self.do_transform = self.R.rand() < self.prob
         if self.do_transform:
-            self.rand_offset = self.R.uniform(-1., 1., [3] + list(grid_size))
+            # a float32 buffer reused while the grid size is unchanged, one uniform draw fills it.
+            offset_shape = tuple([3] + list(grid_size))
+            if self.rand_offset is None or self.rand_offset.shape != offset_shape:
+                self.rand_offset = np.empty(offset_shape, dtype=np.float32)
+            self.rand_offset[...] = self.R.uniform(-1., 1., offset_shape)
         self.magnitude = self.R.uniform(self.magnitude_range[0], self.magnitude_range[1])
         self.sigma = self.R.uniform(self.sigma_range[0], self.sigma_range[1])
+        if self.do_transform:  # the smoothing kernel only depends on sigma, derive it once per draw
+            self.gaussian = GaussianFilter(3, self.sigma, 3., device=self.device)
         self.rand_affine_grid.randomize()
 
     def __call__(self, img, spatial_size=None, mode=None):
@@ -1731,10 +1853,27 @@ class Rand3DElastic(Randomizable, Transform):
         spatial_size = spatial_size or self.spatial_size
         mode = mode or self.mode
         self.randomize(spatial_size)
-        grid = create_grid(spatial_size)
-        if self.do_transform:
-            grid = torch.as_tensor(np.ascontiguousarray(grid), device=self.device)
-            gaussian = GaussianFilter(3, self.sigma, 3., device=self.device)
-            grid[:3] += gaussian(self.rand_offset[None])[0] * self.magnitude
-            grid = self.rand_affine_grid(grid=grid)
-        return self.resampler(img, grid, mode)
+        return self.resampler(img, self.elastic_grid(spatial_size), mode)
+
+    def elastic_grid(self, spatial_size):
+        """
+        Build the sampling grid of the current random parameters, `randomize` must be called first.
+        The identity grid of the untransformed case is cached and shared across calls, it must not be modified.
+
+        Args:
+            spatial_size (3 ints): specifying spatial 3D output image spatial size [h, w, d].
+        """
+        # the identity grid is created once per spatial size and device, together with a work buffer
+        # in which the offsets are added (the affine grid only reads it, so it is overwritten at the next call).
+        key = (tuple(spatial_size), self.device)
+        cache = self._grid_cache
+        if cache is None or cache[0] != key:
+            base_grid = torch.as_tensor(create_grid(spatial_size, dtype=np.float32), device=self.device)
+            cache = (key, base_grid, torch.empty_like(base_grid))
+            self._grid_cache = cache
+        _, base_grid, grid_buffer = cache
+        if not self.do_transform:
+            return base_grid
+        grid = grid_buffer.copy_(base_grid)
+        grid[:3].add_(self.gaussian(self.rand_offset[None])[0], alpha=float(self.magnitude))
+        return self.rand_affine_grid(grid=grid)
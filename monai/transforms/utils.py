@@ -61,8 +61,19 @@ def rescale_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
     if mina == maxa:
         return arr * minv
 
-    norm = (arr - mina) / (maxa - mina)  # normalize the array first
-    return (norm * (maxv - minv)) + minv  # rescale by minv and maxv, which is the normalized array by default
+    # a single output buffer, every following step updates it in place.
+    if not np.issubdtype(arr.dtype, np.floating):
+        norm = arr.astype(np.float64)  # integer values are rescaled as floats
+        norm -= mina
+    elif dtype is not None:
+        norm = arr  # `astype` has already made a private copy
+        norm -= mina
+    else:
+        norm = arr - mina
+    norm /= (maxa - mina)  # normalize the array first
+    norm *= (maxv - minv)  # rescale by minv and maxv, which is the normalized array by default
+    norm += minv
+    return norm
 
 
 def rescale_instance_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
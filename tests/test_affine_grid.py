@@ -70,6 +70,23 @@ class TestAffineGrid(unittest.TestCase):
         else:
             np.testing.assert_allclose(result, expected_val, rtol=1e-4, atol=1e-4)
 
+    def test_cached_affine_updates(self):
+        rotate_params = [0.5, 0.2, 0.1]
+        g = AffineGrid(rotate_params=rotate_params, scale_params=(2., 1., 1.), as_tensor_output=False)
+        g(spatial_size=(3, 4, 5))
+
+        rotate_params[0] = 1.2  # changed in place
+        expected = AffineGrid(rotate_params=[1.2, 0.2, 0.1], scale_params=(2., 1., 1.), as_tensor_output=False)
+        np.testing.assert_allclose(g(spatial_size=(3, 4, 5)), expected(spatial_size=(3, 4, 5)), rtol=1e-5)
+
+        expected = AffineGrid(rotate_params=[1.2, 0.2, 0.1], scale_params=(2., 1., 1.), as_tensor_output=False)
+        np.testing.assert_allclose(g(spatial_size=(2, 3, 2)), expected(spatial_size=(2, 3, 2)), rtol=1e-5)
+
+        g.rotate_params = 0.3  # a different number of spatial dims
+        g.scale_params = (2., 1.)
+        expected = AffineGrid(rotate_params=0.3, scale_params=(2., 1.), as_tensor_output=False)
+        np.testing.assert_allclose(g(spatial_size=(4, 3)), expected(spatial_size=(4, 3)), rtol=1e-5)
+
 
 if __name__ == '__main__':
     unittest.main()
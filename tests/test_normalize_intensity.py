@@ -12,6 +12,7 @@
 import unittest
 
 import numpy as np
+import torch
 from parameterized import parameterized
 from monai.transforms import NormalizeIntensity
 from tests.utils import NumpyImageTestCase2D
@@ -51,6 +52,14 @@ class TestNormalizeIntensity(NumpyImageTestCase2D):
         expected = (self.imt - np.mean(self.imt)) / np.std(self.imt)
         np.testing.assert_allclose(normalized, expected, rtol=1e-6)
 
+    def test_tensor(self):
+        normalizer = NormalizeIntensity()
+        input_data = torch.tensor([[0., 3., 0., 4.], [0., 4., 0., 5.]])
+        expected = (input_data.numpy() - np.mean(input_data.numpy())) / np.std(input_data.numpy())
+        normalized = normalizer(input_data)
+        self.assertTrue(torch.is_tensor(normalized))
+        np.testing.assert_allclose(normalized.numpy(), expected, rtol=1e-6)
+
     @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
     def test_nonzero(self, input_param, input_data, expected_data):
         normalizer = NormalizeIntensity(**input_param)
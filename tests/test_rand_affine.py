@@ -26,6 +26,11 @@ TEST_CASES = [
         dict(as_tensor_output=True, device=None), {'img': torch.ones((1, 3, 3, 3)), 'spatial_size': (2, 2, 2)},
         torch.ones((1, 2, 2, 2))
     ],
+    [
+        dict(prob=0.0, rotate_range=(np.pi / 2,), as_tensor_output=False, device=None),
+        {'img': np.arange(9).reshape((1, 3, 3)), 'spatial_size': (3, 3)},
+        np.array([[[0., 0.5, 0.5], [1.5, 4., 2.5], [1.5, 3.5, 2.]]])
+    ],
     [
         dict(prob=0.9,
              rotate_range=(np.pi / 2,),
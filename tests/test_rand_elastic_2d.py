@@ -44,6 +44,14 @@ TEST_CASES = [
         np.array([[[0.2001334, 1.2563337], [5.2274017, 7.90148]], [[8.675412, 6.9098353], [13.019891, 16.850012]],
                   [[17.15069, 12.563337], [20.81238, 25.798544]]])
     ],
+    [
+        {
+            'spacing': (1., 1.), 'magnitude_range': (0., 0.), 'prob': 1.0, 'padding_mode': 'border',
+            'grid_upsample_mode': 'bilinear', 'as_tensor_output': False, 'device': None, 'spatial_size': (3, 3),
+        },
+        {'img': torch.arange(9).reshape((1, 3, 3))},
+        np.arange(9).reshape((1, 3, 3)),
+    ],
 ]
 
 
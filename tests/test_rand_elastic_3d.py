@@ -21,6 +21,9 @@ TEST_CASES = [
     [{'magnitude_range': (.3, 2.3), 'sigma_range': (1., 20.), 'prob': 0.0, 'as_tensor_output': False, 'device': None},
      {'img': torch.ones((2, 3, 3, 3)), 'spatial_size': (2, 2, 2)},
      np.ones((2, 2, 2, 2))],
+    [{'magnitude_range': (.3, 2.3), 'sigma_range': (1., 20.), 'prob': 0.0, 'as_tensor_output': False, 'device': None},
+     {'img': np.arange(8).reshape((1, 2, 2, 2)), 'spatial_size': (2, 2, 2)},
+     np.arange(8).reshape((1, 2, 2, 2)) * 0.125],
     [
         {'magnitude_range': (.3, .3), 'sigma_range': (1., 2.), 'prob': 0.9, 'as_tensor_output': False, 'device': None},
         {'img': torch.arange(27).reshape((1, 3, 3, 3)), 'spatial_size': (2, 2, 2)},
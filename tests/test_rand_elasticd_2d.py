@@ -64,6 +64,15 @@ TEST_CASES = [
                               [[17.15069, 12.563337], [20.81238, 25.798544]]]),
          'seg': torch.tensor([[[0., 2.], [6., 8.]], [[9., 11.], [15., 17.]], [[18., 20.], [24., 26.]]])}
     ],
+    [
+        {
+            'keys': ('img', 'seg'), 'spacing': (1., 1.), 'magnitude_range': (0., 0.), 'prob': 1.0,
+            'padding_mode': 'border', 'grid_upsample_mode': 'bilinear', 'as_tensor_output': False, 'device': None,
+            'spatial_size': (3, 3),
+        },
+        {'img': torch.arange(9).reshape((1, 3, 3)), 'seg': torch.arange(9).reshape((1, 3, 3))},
+        np.arange(9).reshape((1, 3, 3)),
+    ],
 ]
 
 
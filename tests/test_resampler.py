@@ -24,6 +24,17 @@ TEST_CASES = [
         {'grid': create_grid((2, 2)), 'img': np.arange(4).reshape((1, 2, 2))},
         np.array([[[0., 0.25], [0.5, 0.75]]])
     ],
+    [
+        dict(padding_mode='zeros', as_tensor_output=False, device=None),
+        {'grid': create_grid((2, 2)), 'img': np.arange(8).reshape((2, 1, 2, 2)), 'batched': True},
+        np.array([[[[0., 0.25], [0.5, 0.75]]], [[[1., 1.25], [1.5, 1.75]]]])
+    ],
+    [
+        dict(padding_mode='zeros', as_tensor_output=False, device=None),
+        {'grid': np.stack([create_grid((2, 2)), create_grid((2, 2)) * np.array([-1., -1., 1.]).reshape((3, 1, 1))]),
+         'img': np.arange(8).reshape((2, 1, 2, 2)), 'batched': True},
+        np.array([[[[0., 0.25], [0.5, 0.75]]], [[[1.75, 1.5], [1.25, 1.]]]])
+    ],
     [
         dict(padding_mode='zeros', as_tensor_output=False, device=None),
         {'grid': create_grid((4, 4)), 'img': np.arange(4).reshape((1, 2, 2))},
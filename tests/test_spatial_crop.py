@@ -50,14 +50,27 @@ TEST_CASE_4 = [
     (3, 2, 2, 2),
 ]
 
+TEST_CASE_5 = [
+    {
+        'roi_center': [1.6, 1.2, 1.9],
+        'roi_size': [2, 2, 2]
+    },
+    np.random.randint(0, 2, size=[3, 3, 3, 3]),
+    (3, 2, 2, 2),
+]
+
 
 class TestSpatialCrop(unittest.TestCase):
 
-    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4])
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4, TEST_CASE_5])
     def test_shape(self, input_param, input_data, expected_shape):
         result = SpatialCrop(**input_param)(input_data)
         self.assertTupleEqual(result.shape, expected_shape)
 
+    def test_negative_start(self):
+        with self.assertRaises(AssertionError):
+            SpatialCrop(roi_center=[0, 1, 1], roi_size=[2, 2, 2])
+
 
 if __name__ == '__main__':
     unittest.main()